@@ -6,24 +6,46 @@ only needs to authenticate once (refresh tokens last ~90 days).
 Supports both organisational (work/school) and personal Microsoft accounts.
 Set ``TENANT_ID=consumers`` in ``.env`` for personal accounts, or use your
 Azure AD tenant ID for organisational accounts.
+
+``msal`` and ``dotenv`` are imported lazily: they're only needed once a
+token is actually requested, and importing msal (which pulls in
+cryptography) adds noticeable MCP server start-up time.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import msal
-from dotenv import dotenv_values
+if TYPE_CHECKING:
+    import msal
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path.home() / ".office-assistant"
 CACHE_FILE = CACHE_DIR / "token_cache.json"
 
+# MSAL's PublicClientApplication re-parses authority metadata and re-wires
+# its token cache on construction, so we build it once per process and
+# reuse it (guarded by a lock — get_token runs in worker threads).
+_app_lock = threading.Lock()
+_app: msal.PublicClientApplication | None = None
+_app_key: tuple[str, str] | None = None
+_app_cache: msal.SerializableTokenCache | None = None
+_app_cache_mtime: float | None = None
+# Digest of the last cache payload written to disk, so a "state changed"
+# flag that serializes to identical bytes doesn't trigger a rewrite.
+_last_saved_digest: bytes | None = None
+# Set once the cache directory is known to exist, skipping the mkdir
+# syscall on every subsequent save.
+_cache_dir_ready = False
+
 
 class AuthenticationRequired(Exception):
     """Raised when the user needs to sign in via the device code flow.
@@ -52,20 +74,22 @@ class AuthenticationRequired(Exception):
 
 # Organisational accounts support shared calendar access; personal accounts
 # do not, so we request a narrower set of scopes for consumer tenants.
-_ORG_SCOPES = [
+# Kept as sorted tuples: immutable, and a stable order keeps MSAL's
+# internal scope-based cache keys consistent between calls.
+_ORG_SCOPES = (
     "Calendars.ReadWrite",
     "Calendars.ReadWrite.Shared",
     "Place.Read.All",
     "User.Read",
-]
-_PERSONAL_SCOPES = [
+)
+_PERSONAL_SCOPES = (
     "Calendars.ReadWrite",
     "User.Read",
-]
+)
 
 # Tenant IDs that indicate a personal / multi-tenant authority rather than
 # a specific Azure AD organisation.
-_NON_ORG_TENANTS = {"consumers", "common"}
+_NON_ORG_TENANTS = frozenset({"consumers", "common"})
 
 
 def _is_personal_tenant(tenant_id: str) -> bool:
@@ -73,6 +97,31 @@ def _is_personal_tenant(tenant_id: str) -> bool:
     return tenant_id.lower() in _NON_ORG_TENANTS
 
 
+@functools.lru_cache(maxsize=4)
+def _tenant_settings(tenant_id: str) -> tuple[str, tuple[str, ...]]:
+    """Return the (authority URL, scopes) pair for *tenant_id*.
+
+    Cached so the hot token path doesn't rebuild the authority string or
+    re-branch on the account type for every request.
+    """
+    authority = f"https://login.microsoftonline.com/{tenant_id}"
+    scopes = _PERSONAL_SCOPES if _is_personal_tenant(tenant_id) else _ORG_SCOPES
+    return authority, scopes
+
+
+@functools.lru_cache(maxsize=4)
+def _dotenv_config(dotenv_path: str, mtime_ns: int) -> dict[str, str | None]:
+    """Parse the .env file once per (path, mtime) pair.
+
+    Keying on the mtime means a re-run of setup (which rewrites .env)
+    takes effect without a restart, while the steady state costs one
+    stat instead of a parse.  Tests clear this via ``cache_clear``.
+    """
+    from dotenv import dotenv_values
+
+    return dotenv_values(dotenv_path)
+
+
 def _load_env() -> tuple[str, str]:
     """Load CLIENT_ID and TENANT_ID from environment or the .env file.
 
@@ -85,7 +134,11 @@ def _load_env() -> tuple[str, str]:
     For organisational (work/school) accounts use your Azure AD tenant ID.
     """
     dotenv_path = os.environ.get("DOTENV_PATH", ".env")
-    config = dotenv_values(dotenv_path)
+    try:
+        mtime_ns = os.stat(dotenv_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    config = _dotenv_config(dotenv_path, mtime_ns)
 
     client_id = (os.environ.get("CLIENT_ID") or config.get("CLIENT_ID") or "").strip()
     tenant_id = (os.environ.get("TENANT_ID") or config.get("TENANT_ID") or "").strip()
@@ -100,23 +153,111 @@ def _load_env() -> tuple[str, str]:
 
 def _build_cache() -> msal.SerializableTokenCache:
     """Load the persistent token cache from disk."""
+    import msal
+
     cache = msal.SerializableTokenCache()
-    if CACHE_FILE.exists():
-        try:
-            cache.deserialize(CACHE_FILE.read_text())
-        except (json.JSONDecodeError, ValueError, KeyError):
-            logger.warning("Token cache at %s is corrupt, starting fresh", CACHE_FILE)
-            return msal.SerializableTokenCache()
+    try:
+        # Read as bytes: skips the separate exists() stat and text-mode
+        # newline/encoding layer; decode once, only when there's content.
+        raw = CACHE_FILE.read_bytes()
+    except OSError:
+        return cache
+    if not raw:
+        return cache
+    try:
+        cache.deserialize(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError, ValueError, KeyError):
+        logger.warning("Token cache at %s is corrupt, starting fresh", CACHE_FILE)
+        return msal.SerializableTokenCache()
     return cache
 
 
+def _cache_file_mtime() -> float | None:
+    """Return the token cache file's mtime, or None if it doesn't exist."""
+    try:
+        return CACHE_FILE.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _reset_app() -> None:
+    """Drop the cached PublicClientApplication (used after cache clears)."""
+    global _app, _app_key, _app_cache, _app_cache_mtime, _last_saved_digest, _cache_dir_ready
+    with _app_lock:
+        _app = None
+        _app_key = None
+        _app_cache = None
+        _app_cache_mtime = None
+        _last_saved_digest = None
+        _cache_dir_ready = False
+
+
+def _get_app(
+    client_id: str, tenant_id: str
+) -> tuple[msal.PublicClientApplication, msal.SerializableTokenCache]:
+    """Get (or build) the process-wide MSAL application for these credentials.
+
+    The on-disk token cache is reloaded only when its mtime changes (e.g.
+    another process re-authenticated), not on every call.
+    """
+    import msal
+
+    global _app, _app_key, _app_cache, _app_cache_mtime
+    with _app_lock:
+        if _app is None or _app_cache is None or _app_key != (client_id, tenant_id):
+            _app_cache = _build_cache()
+            _app_cache_mtime = _cache_file_mtime()
+            # tenant_id can be:
+            #   - A specific tenant GUID: restricts sign-in to that org's accounts
+            #   - "common": allows both work/school and personal Microsoft accounts
+            #   - "consumers": allows personal Microsoft accounts only
+            authority, _ = _tenant_settings(tenant_id)
+            _app = msal.PublicClientApplication(
+                client_id,
+                authority=authority,
+                token_cache=_app_cache,
+            )
+            _app_key = (client_id, tenant_id)
+        else:
+            mtime = _cache_file_mtime()
+            if mtime != _app_cache_mtime:
+                logger.debug("Token cache file changed on disk, reloading")
+                _app_cache.deserialize(CACHE_FILE.read_text() if mtime is not None else "{}")
+                _app_cache_mtime = mtime
+        return _app, _app_cache
+
+
 def _save_cache(cache: msal.SerializableTokenCache) -> None:
     """Write the token cache back to disk if anything changed."""
-    if cache.has_state_changed:
+    global _app_cache_mtime, _last_saved_digest, _cache_dir_ready
+    if not cache.has_state_changed:
+        return
+
+    serialized = cache.serialize()
+    digest = hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).digest()
+    if digest == _last_saved_digest:
+        return
+
+    if not _cache_dir_ready:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        CACHE_FILE.write_text(cache.serialize())
-        # Restrict to owner-only read/write since this contains auth tokens.
-        CACHE_FILE.chmod(0o600)
+        _cache_dir_ready = True
+    # Write to a sibling temp file and rename so a crash mid-write can't
+    # corrupt the cache (corruption forces the user through re-auth).
+    tmp_file = CACHE_FILE.with_suffix(".tmp")
+    try:
+        tmp_file.write_text(serialized)
+    except FileNotFoundError:
+        # The cache directory was removed mid-session; recreate it and
+        # retry once rather than letting the error escape get_token().
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(serialized)
+    # Restrict to owner-only read/write since this contains auth tokens.
+    tmp_file.chmod(0o600)
+    os.replace(tmp_file, CACHE_FILE)
+    _last_saved_digest = digest
+    # Our own write shouldn't look like an external change next call.
+    if cache is _app_cache:
+        _app_cache_mtime = _cache_file_mtime()
 
 
 def get_token() -> str:
@@ -133,27 +274,13 @@ def get_token() -> str:
         RuntimeError: If credentials are missing or authentication fails.
     """
     client_id, tenant_id = _load_env()
-    cache = _build_cache()
-
-    # tenant_id can be:
-    #   - A specific tenant GUID: restricts sign-in to that org's accounts
-    #   - "common": allows both work/school and personal Microsoft accounts
-    #   - "consumers": allows personal Microsoft accounts only
-    authority = f"https://login.microsoftonline.com/{tenant_id}"
-
-    # Choose the right scope set for the account type.
-    scopes = _PERSONAL_SCOPES if _is_personal_tenant(tenant_id) else _ORG_SCOPES
-
-    app = msal.PublicClientApplication(
-        client_id,
-        authority=authority,
-        token_cache=cache,
-    )
+    _, scopes = _tenant_settings(tenant_id)
+    app, cache = _get_app(client_id, tenant_id)
 
     # Try silent acquisition first (cached / refresh token).
     accounts = app.get_accounts()
     if accounts:
-        result = app.acquire_token_silent(scopes, account=accounts[0])
+        result = app.acquire_token_silent(list(scopes), account=accounts[0])
         if result and "access_token" in result:
             logger.debug("Token acquired silently for %s", accounts[0].get("username"))
             _save_cache(cache)
@@ -161,7 +288,7 @@ def get_token() -> str:
 
     # Fall back to device-code flow.
     logger.info("No cached token, starting device-code flow")
-    flow = app.initiate_device_flow(scopes=scopes)
+    flow = app.initiate_device_flow(scopes=list(scopes))
     if "user_code" not in flow:
         error_desc = flow.get("error_description", "Unknown error")
         logger.error("Device-code flow failed: %s", error_desc)
@@ -202,9 +329,7 @@ def complete_device_flow(flow: dict[str, Any]) -> str:
         RuntimeError: If authentication fails.
     """
     client_id, tenant_id = _load_env()
-    cache = _build_cache()
-    authority = f"https://login.microsoftonline.com/{tenant_id}"
-    app = msal.PublicClientApplication(client_id, authority=authority, token_cache=cache)
+    app, cache = _get_app(client_id, tenant_id)
 
     result = app.acquire_token_by_device_flow(flow)
 
@@ -224,6 +349,9 @@ def clear_cache() -> bool:
     Returns:
         True if a cache file was deleted, False if none existed.
     """
+    # Also drop the in-process application so its in-memory token cache
+    # can't hand back the token we're trying to discard.
+    _reset_app()
     if CACHE_FILE.exists():
         CACHE_FILE.unlink()
         return True
@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
+import copy
+import functools
+import json
 import logging
+import random
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
@@ -17,9 +25,25 @@ GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=64)
+def _graph_url(path: str) -> httpx.URL:
+    """Pre-parsed URL for *path*; the set of Graph paths repeats heavily."""
+    return httpx.URL(path)
+
+
+# Microsoft Graph allows at most this many sub-requests per $batch call.
+_BATCH_LIMIT = 20
+
+# Number of GET responses kept for ETag revalidation (If-None-Match).
+_ETAG_CACHE_SIZE = 128
+
 # Retry configuration for transient errors (429, 503, 504).
 _MAX_RETRIES = 3
 _RETRY_STATUS_CODES = {429, 503, 504}
+# Same set as a bitmap: status-code membership on the per-request hot
+# path becomes one shift+mask instead of a hashed set lookup.
+_RETRY_BITMAP = sum(1 << code for code in _RETRY_STATUS_CODES)
 _BASE_BACKOFF_SECONDS = 1.0
 
 # Error codes that indicate an expired/invalid token (as opposed to a genuine
@@ -29,6 +53,13 @@ _BASE_BACKOFF_SECONDS = 1.0
 # and should NOT trigger a cache clear + re-auth.
 _AUTH_FAILURE_CODES = {"invalidauthenticationtoken", "unauthorized"}
 
+# Access tokens are cached in-memory and refreshed this many seconds before
+# they expire, so a token never goes stale mid-request.
+_TOKEN_REFRESH_MARGIN_SECONDS = 300.0
+# Used when the token's "exp" claim cannot be read (Graph tokens are JWTs,
+# but we don't want to depend on that).  Graph tokens last 60-90 minutes.
+_TOKEN_FALLBACK_TTL_SECONDS = 55 * 60.0
+
 
 @dataclass(slots=True)
 class GraphApiError(Exception):
@@ -54,20 +85,89 @@ class GraphClient:
     """
 
     def __init__(self) -> None:
-        self._http = httpx.AsyncClient(base_url=GRAPH_BASE_URL, timeout=30.0)
+        # HTTP/2 lets concurrent requests (tool fan-out, pagination) share
+        # one TLS connection; generous keepalive keeps it warm between
+        # tool invocations in the same MCP session.
+        self._http = httpx.AsyncClient(
+            base_url=GRAPH_BASE_URL,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=60.0,
+            ),
+        )
+        self._token: str | None = None
+        # Prebuilt header mapping for the cached token, shared across
+        # requests; never mutated (merges copy it).
+        self._auth_header: dict[str, str] = {}
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        # Last-seen ETag + body per GET, so unchanged resources can be
+        # revalidated with a bodyless 304 instead of re-downloaded.
+        self._etag_cache: OrderedDict[
+            tuple[str, tuple[tuple[str, str], ...] | None],
+            tuple[str, dict[str, Any]],
+        ] = OrderedDict()
 
     async def close(self) -> None:
         """Close the underlying HTTP connection pool."""
         await self._http.aclose()
 
+    @staticmethod
+    def _token_lifetime(token: str) -> float:
+        """Return the token's remaining lifetime in seconds.
+
+        Graph access tokens are JWTs, so we read the ``exp`` claim from the
+        payload segment.  If the token isn't a readable JWT, fall back to a
+        conservative TTL.
+        """
+        try:
+            payload_b64 = token.split(".")[1]
+            padded = payload_b64 + "=" * (-len(payload_b64) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            return float(payload["exp"]) - time.time()
+        except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+            return _TOKEN_FALLBACK_TTL_SECONDS
+
+    def _invalidate_token(self) -> None:
+        """Drop the in-memory token so the next request fetches a fresh one."""
+        self._token = None
+        self._auth_header = {}
+        self._token_expires_at = 0.0
+
     async def _auth_headers(self) -> dict[str, str]:
-        # get_token() is synchronous (MSAL) and may block during device-code
-        # flow, so run it in a thread to avoid blocking the event loop.
-        token = await asyncio.to_thread(get_token)
-        return {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        # Fast path: a valid cached token skips the lock and the thread
+        # pool entirely — this is the common case for every request after
+        # the first.
+        token = self._token
+        if (
+            token is not None
+            and time.monotonic() < self._token_expires_at - _TOKEN_REFRESH_MARGIN_SECONDS
+        ):
+            return self._auth_header
+
+        # The lock coalesces concurrent refreshes into a single MSAL call.
+        async with self._token_lock:
+            # Re-check: another task may have refreshed while we waited.
+            if (
+                self._token is None
+                or time.monotonic() >= self._token_expires_at - _TOKEN_REFRESH_MARGIN_SECONDS
+            ):
+                # get_token() is synchronous (MSAL) and may block during
+                # device-code flow, so run it in a thread to avoid blocking
+                # the event loop.  run_in_executor is used over
+                # asyncio.to_thread to skip the contextvars copy to_thread
+                # does on every call — get_token doesn't read any.
+                loop = asyncio.get_running_loop()
+                token = await loop.run_in_executor(None, get_token)
+                self._token = token
+                # httpx sets Content-Type itself on json= requests, so
+                # bodyless GET/DELETE requests don't carry it at all.
+                self._auth_header = {"Authorization": f"Bearer {token}"}
+                self._token_expires_at = time.monotonic() + self._token_lifetime(token)
+        return self._auth_header
 
     @staticmethod
     def _parse_retry_after(value: str | None) -> int | None:
@@ -92,7 +192,10 @@ class GraphClient:
         code: str | None = None
         message = f"HTTP {resp.status_code}"
         request_id = resp.headers.get("request-id") or resp.headers.get("x-ms-request-id")
-        retry_after_seconds = self._parse_retry_after(resp.headers.get("Retry-After"))
+        # Most errors carry no Retry-After; skip the integer/HTTP-date
+        # parse attempt (and its datetime work) entirely in that case.
+        retry_after = resp.headers.get("Retry-After")
+        retry_after_seconds = self._parse_retry_after(retry_after) if retry_after else None
 
         try:
             payload = resp.json()
@@ -100,12 +203,16 @@ class GraphClient:
             payload = None
 
         if isinstance(payload, dict):
-            err = payload.get("error")
-            if isinstance(err, dict):
+            # Single lookup chain; malformed shapes fall through to the
+            # top-level "message" key that some endpoints use instead.
+            try:
+                err = payload["error"]
                 code = err.get("code")
                 message = err.get("message") or message
-            elif isinstance(payload.get("message"), str):
-                message = payload["message"]
+            except (KeyError, AttributeError, TypeError):
+                fallback = payload.get("message")
+                if isinstance(fallback, str):
+                    message = fallback
 
         raise GraphApiError(
             status_code=resp.status_code,
@@ -129,6 +236,11 @@ class GraphClient:
             return True
         if resp.status_code != 403:
             return False
+        # Cheap byte scan first: the invalid-token code is unambiguous
+        # wherever it appears, so most 403s are classified without a
+        # JSON parse.
+        if b"invalidauthenticationtoken" in resp.content.lower():
+            return True
         # Parse the error code from the response body.
         try:
             payload = resp.json()
@@ -153,11 +265,15 @@ class GraphClient:
         Also handles auth failures (401/403) by clearing the token cache
         and re-authenticating once before giving up.
         """
+        extra_headers: dict[str, str] | None = kwargs.pop("headers", None)
         headers = await self._auth_headers()
+        if extra_headers:
+            headers = {**headers, **extra_headers}
         resp: httpx.Response | None = None
 
+        url = _graph_url(path)
         for attempt in range(_MAX_RETRIES):
-            resp = await self._http.request(method, path, headers=headers, **kwargs)
+            resp = await self._http.request(method, url, headers=headers, **kwargs)
 
             # Token expired/revoked — clear cache and get a fresh token once.
             # 401 is always an auth failure.  403 is only an auth failure if
@@ -169,9 +285,12 @@ class GraphClient:
                     "Got %d, clearing token cache and re-authenticating",
                     resp.status_code,
                 )
+                self._invalidate_token()
                 clear_cache()
                 try:
                     headers = await self._auth_headers()
+                    if extra_headers:
+                        headers = {**headers, **extra_headers}
                 except AuthenticationRequired:
                     # Token cache was cleared but silent refresh failed —
                     # the user needs to sign in again.  Return the original
@@ -182,15 +301,16 @@ class GraphClient:
                     return resp
                 continue
 
-            if resp.status_code not in _RETRY_STATUS_CODES:
+            if not (_RETRY_BITMAP >> resp.status_code) & 1:
                 return resp
 
             # Parse retry delay from server or use exponential backoff.
             retry_after = self._parse_retry_after(resp.headers.get("Retry-After"))
             if retry_after is not None:
-                delay = retry_after
+                delay = float(retry_after)
             else:
-                delay = _BASE_BACKOFF_SECONDS * (2**attempt)
+                # Jitter stops concurrent clients from retrying in lockstep.
+                delay = _BASE_BACKOFF_SECONDS * (2**attempt) + random.random()
 
             logger.warning(
                 "Graph API %s %s returned %d (attempt %d/%d), retrying in %.1fs",
@@ -218,9 +338,25 @@ class GraphClient:
 
     async def get(self, path: str, params: dict[str, str] | None = None) -> dict[str, Any]:
         logger.debug("GET %s", path)
-        resp = await self._request_with_retry("GET", path, params=params)
+        cache_key = (path, tuple(sorted(params.items())) if params else None)
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = await self._request_with_retry("GET", path, params=params, headers=headers)
+
+        if resp.status_code == 304 and cached is not None:
+            logger.debug("GET %s not modified, serving cached body", path)
+            self._etag_cache.move_to_end(cache_key)
+            # Deep copy: callers (e.g. get_all) mutate the returned dict.
+            return copy.deepcopy(cached[1])
+
         self._ensure_success(resp)
         result: dict[str, Any] = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, copy.deepcopy(result))
+            self._etag_cache.move_to_end(cache_key)
+            while len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
         return result
 
     async def get_all(
@@ -238,17 +374,30 @@ class GraphClient:
         """
         logger.debug("GET (paginated) %s", path)
         data = await self.get(path, params=params)
-        all_items = list(data.get("value", []))
+        # We own the parsed page, so extend its list in place rather than
+        # copying the (possibly large) first page.
+        all_items = data.get("value", [])
 
         pages = 1
         next_link = data.get("@odata.nextLink")
-        while next_link and pages < max_pages:
+        # Pipeline the page fetches: the request for page N+1 is started
+        # before page N's items are merged, so accumulation overlaps the
+        # next network round-trip instead of running strictly in series.
+        prefetch: asyncio.Task[dict[str, Any]] | None = None
+        if next_link and pages < max_pages:
+            prefetch = asyncio.create_task(self.get(next_link))
+        while prefetch is not None:
             logger.debug("Following nextLink (page %d): %s", pages + 1, next_link)
+            page_data = await prefetch
+            pages += 1
+            next_link = page_data.get("@odata.nextLink")
             # Graph returns an opaque URL. Request it as-is per Graph docs.
-            page_data = await self.get(next_link)
+            prefetch = (
+                asyncio.create_task(self.get(next_link))
+                if next_link and pages < max_pages
+                else None
+            )
             all_items.extend(page_data.get("value", []))
-            next_link = page_data.get("@odata.nextLink")
-            pages += 1
 
         if next_link:
             logger.warning("Pagination capped at %d pages, results may be incomplete", max_pages)
@@ -257,21 +406,58 @@ class GraphClient:
         data.pop("@odata.nextLink", None)
         return data
 
-    async def post(self, path: str, json: dict[str, Any]) -> dict[str, Any]:
+    async def batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Execute up to 20 Graph requests in a single ``/$batch`` round-trip.
+
+        Each entry needs at least ``method`` and ``url`` (relative to the
+        API root, e.g. ``/me/calendars``); an ``id`` is assigned from the
+        list position when omitted.  Returns the sub-responses in the same
+        order as *requests*.
+
+        Sub-requests fail individually: the batch call itself succeeding
+        does not mean every sub-response did, so callers must check each
+        entry's ``status``.
+        """
+        if not requests:
+            return []
+        if len(requests) > _BATCH_LIMIT:
+            raise ValueError(f"Graph $batch accepts at most {_BATCH_LIMIT} requests per call")
+
+        prepared = [{"id": str(index), **req} for index, req in enumerate(requests)]
+        logger.debug("POST /$batch (%d sub-requests)", len(prepared))
+        data = await self.post("/$batch", json={"requests": prepared})
+
+        by_id = {resp.get("id"): resp for resp in data.get("responses", [])}
+        return [by_id.get(entry["id"], {"id": entry["id"], "status": 0}) for entry in prepared]
+
+    async def post(
+        self, path: str, json: dict[str, Any], *, minimal: bool = False
+    ) -> dict[str, Any]:
+        """POST to *path*.
+
+        With ``minimal=True``, asks Graph not to echo the resource back
+        (``Prefer: return=minimal``) and skips parsing the body — for
+        callers that discard the response.
+        """
         logger.debug("POST %s", path)
-        resp = await self._request_with_retry("POST", path, json=json)
+        headers = {"Prefer": "return=minimal"} if minimal else None
+        resp = await self._request_with_retry("POST", path, json=json, headers=headers)
         self._ensure_success(resp)
         # Some endpoints (e.g. /events/{id}/cancel) return 202 with no body.
-        if resp.status_code == 202 or not resp.content:
+        if minimal or resp.status_code == 202 or not resp.content:
             return {}
         result: dict[str, Any] = resp.json()
         return result
 
-    async def patch(self, path: str, json: dict[str, Any]) -> dict[str, Any]:
+    async def patch(
+        self, path: str, json: dict[str, Any], *, minimal: bool = False
+    ) -> dict[str, Any]:
+        """PATCH *path*; ``minimal=True`` behaves as for :meth:`post`."""
         logger.debug("PATCH %s", path)
-        resp = await self._request_with_retry("PATCH", path, json=json)
+        headers = {"Prefer": "return=minimal"} if minimal else None
+        resp = await self._request_with_retry("PATCH", path, json=json, headers=headers)
         self._ensure_success(resp)
-        if not resp.content:
+        if minimal or not resp.content:
             return {}
         result: dict[str, Any] = resp.json()
         return result
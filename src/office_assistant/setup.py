@@ -5,16 +5,10 @@ Run with: uv run python -m office_assistant.setup
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
-from office_assistant.auth import (
-    CACHE_FILE,
-    AuthenticationRequired,
-    complete_device_flow,
-    get_token,
-)
-
 
 def _dotenv_path() -> Path:
     """Resolve the .env file path."""
@@ -23,29 +17,27 @@ def _dotenv_path() -> Path:
     return Path(os.environ.get("DOTENV_PATH", ".env"))
 
 
-def _load_existing_env() -> tuple[str, str]:
-    """Load CLIENT_ID and TENANT_ID from existing .env file."""
-    path = _dotenv_path()
-    if not path.exists():
-        return "", ""
+@functools.cache
+def _read_env_file(path_str: str, mtime_ns: int) -> tuple[str, str]:
+    """Parse CLIENT_ID/TENANT_ID from a .env file, memoized per (path, mtime)."""
     from dotenv import dotenv_values
 
-    config = dotenv_values(path)
+    config = dotenv_values(path_str)
     return config.get("CLIENT_ID") or "", config.get("TENANT_ID") or ""
 
 
-def _env_is_complete() -> bool:
-    client_id, tenant_id = _load_existing_env()
-    return bool(client_id) and bool(tenant_id)
+def _load_existing_env() -> tuple[str, str]:
+    """Load CLIENT_ID and TENANT_ID from existing .env file."""
+    path = _dotenv_path()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return "", ""
+    return _read_env_file(str(path), mtime_ns)
 
 
-def _create_env_file() -> None:
+def _create_env_file(existing_client_id: str, existing_tenant_id: str) -> None:
     """Prompt the user for credentials and write the .env file."""
-    existing_client_id, existing_tenant_id = _load_existing_env()
-
-    if existing_client_id and existing_tenant_id:
-        return  # Already complete
-
     print()
     if existing_client_id or existing_tenant_id:
         print("Your credentials file is incomplete. Let's fill in the missing values.")
@@ -99,6 +91,15 @@ def _create_env_file() -> None:
 
 def _authenticate() -> None:
     """Ensure we have a valid token, prompting the user if needed."""
+    # Imported here so the env prompts appear instantly; auth (and the
+    # MSAL machinery behind it) only loads once sign-in actually starts.
+    from office_assistant.auth import (
+        CACHE_FILE,
+        AuthenticationRequired,
+        complete_device_flow,
+        get_token,
+    )
+
     try:
         get_token()
         print()
@@ -117,8 +118,10 @@ def _authenticate() -> None:
 
 
 def main() -> None:
-    if not _env_is_complete():
-        _create_env_file()
+    # One read serves both the completeness check and the prompt prefill.
+    client_id, tenant_id = _load_existing_env()
+    if not (client_id and tenant_id):
+        _create_env_file(client_id, tenant_id)
 
     _authenticate()
 
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-import re
 from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -15,7 +15,36 @@ from office_assistant.graph_client import GraphApiError, GraphClient
 
 logger = logging.getLogger(__name__)
 
-_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# Graph error classification, from most to least specific.  Either the
+# status code or the (lowercased) error code can place an error in a
+# tier; the earlier tier wins.  A None message means "use exc.message".
+_ERROR_TIERS: tuple[tuple[str, str | None], ...] = (
+    (
+        "auth_error",
+        "Your sign-in has expired or is invalid. Type /calendar-setup to reconnect "
+        "your Microsoft account.",
+    ),
+    ("permission_denied", "You don't have permission to perform this action."),
+    ("not_found", "The requested resource was not found."),
+    ("throttled", "Too many requests — please wait a moment and try again."),
+    ("validation_error", None),
+    ("graph_error", None),
+)
+_STATUS_TIERS = {401: 0, 403: 1, 404: 2, 429: 3, 400: 4}
+_CODE_TIERS = {
+    "invalidauthenticationtoken": 0,
+    "unauthorized": 0,
+    "erroraccessdenied": 1,
+    "accessdenied": 1,
+    "erroritemnotfound": 2,
+    "resourcenotfound": 2,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Construct a ZoneInfo once per name — it re-reads tzdata each time."""
+    return ZoneInfo(name)
 
 
 def get_graph(ctx: Context) -> GraphClient:
@@ -24,9 +53,31 @@ def get_graph(ctx: Context) -> GraphClient:
     return client
 
 
+def _is_valid_email(email: str) -> bool:
+    r"""Cheap shape check: one ``@``, dotted domain, no whitespace.
+
+    Equivalent to the ``^[^@\s]+@[^@\s]+\.[^@\s]+$`` regex this
+    replaced, but plain string ops beat the regex engine on short inputs.
+    """
+    local, at, domain = email.partition("@")
+    if not at or not local or "@" in domain:
+        return False
+    head, dot, tail = domain.rpartition(".")
+    if not dot or not head or not tail:
+        return False
+    return not any(ch.isspace() for ch in email)
+
+
 def validate_emails(emails: list[str]) -> str | None:
     """Return an error message if any email is clearly invalid, else None."""
-    bad = [e for e in emails if not _EMAIL_RE.match(e)]
+    # Three examples are enough to point at the typo; stop scanning a
+    # long attendee list once the outcome is settled.
+    bad: list[str] = []
+    for email in emails:
+        if not _is_valid_email(email):
+            bad.append(email)
+            if len(bad) == 3:
+                break
     if bad:
         return f"Invalid email address(es): {', '.join(bad)}"
     return None
@@ -35,37 +86,43 @@ def validate_emails(emails: list[str]) -> str | None:
 def validate_timezone(timezone_name: str, field_name: str) -> str | None:
     """Validate a timezone name as IANA (e.g. Europe/London)."""
     try:
-        ZoneInfo(timezone_name)
+        _zoneinfo(timezone_name)
     except ZoneInfoNotFoundError:
         return f"{field_name} must be a valid IANA timezone (for example, Europe/London)."
     return None
 
 
-def _parse_iso_datetime(value: str) -> datetime:
-    normalized = value.strip()
-    if normalized.endswith("Z"):
-        normalized = f"{normalized[:-1]}+00:00"
-    return datetime.fromisoformat(normalized)
+# datetime.fromisoformat accepts a trailing "Z" natively on Python 3.11+
+# (this project's floor), so no pre-normalization pass is needed.
+_parse_iso_datetime = datetime.fromisoformat
 
 
-def validate_datetime(value: str, field_name: str) -> str | None:
-    """Validate an ISO 8601 datetime string."""
+def _validated_datetime(value: str, field_name: str) -> tuple[datetime | None, str | None]:
+    """Parse an ISO 8601 datetime, returning ``(datetime, error)``.
+
+    Exactly one element is non-None; callers that need the parsed value
+    (e.g. for ordering checks) avoid parsing the string twice.
+    """
     normalized = value.strip()
     if "T" not in normalized and "t" not in normalized:
-        return (
-            f"{field_name} must include both date and time " "(for example, 2026-02-16T09:00:00)."
+        return None, (
+            f"{field_name} must include both date and time (for example, 2026-02-16T09:00:00)."
         )
     try:
-        _parse_iso_datetime(normalized)
+        return _parse_iso_datetime(normalized), None
     except ValueError:
-        return f"{field_name} must be a valid ISO 8601 datetime."
-    return None
+        return None, f"{field_name} must be a valid ISO 8601 datetime."
+
+
+def validate_datetime(value: str, field_name: str) -> str | None:
+    """Validate an ISO 8601 datetime string."""
+    return _validated_datetime(value, field_name)[1]
 
 
 def _coerce_datetime(dt: datetime, tz_name: str | None) -> datetime:
     if not tz_name:
         return dt
-    tz = ZoneInfo(tz_name)
+    tz = _zoneinfo(tz_name)
     if dt.tzinfo is None:
         return dt.replace(tzinfo=tz)
     return dt.astimezone(tz)
@@ -81,9 +138,11 @@ def validate_datetime_order(
     end_timezone: str | None = None,
 ) -> str | None:
     """Validate start/end datetime format and ensure start is before end."""
-    if err := validate_datetime(start_datetime, start_field):
+    start, err = _validated_datetime(start_datetime, start_field)
+    if err or start is None:
         return err
-    if err := validate_datetime(end_datetime, end_field):
+    end, err = _validated_datetime(end_datetime, end_field)
+    if err or end is None:
         return err
 
     if start_timezone and (err := validate_timezone(start_timezone, "start_timezone")):
@@ -91,8 +150,8 @@ def validate_datetime_order(
     if end_timezone and (err := validate_timezone(end_timezone, "end_timezone")):
         return err
 
-    start = _coerce_datetime(_parse_iso_datetime(start_datetime), start_timezone)
-    end = _coerce_datetime(_parse_iso_datetime(end_datetime), end_timezone)
+    start = _coerce_datetime(start, start_timezone)
+    end = _coerce_datetime(end, end_timezone)
 
     if (start.tzinfo is None) != (end.tzinfo is None):
         return (
@@ -133,28 +192,14 @@ def graph_error_response(
         exc.request_id,
     )
     code = (exc.code or "").lower()
-    if exc.status_code == 401 or code in {"invalidauthenticationtoken", "unauthorized"}:
-        error_type = "auth_error"
-        message = (
-            fallback_message
-            or "Your sign-in has expired or is invalid. Type /calendar-setup to reconnect "
-            "your Microsoft account."
-        )
-    elif exc.status_code == 403 or code in {"erroraccessdenied", "accessdenied"}:
-        error_type = "permission_denied"
-        message = fallback_message or "You don't have permission to perform this action."
-    elif exc.status_code == 404 or code in {"erroritemnotfound", "resourcenotfound"}:
-        error_type = "not_found"
-        message = fallback_message or "The requested resource was not found."
-    elif exc.status_code == 429:
-        error_type = "throttled"
-        message = fallback_message or "Too many requests — please wait a moment and try again."
-    elif exc.status_code == 400 or code.startswith("errorinvalid"):
-        error_type = "validation_error"
-        message = fallback_message or exc.message
-    else:
-        error_type = "graph_error"
-        message = fallback_message or exc.message
+    tier = _STATUS_TIERS.get(exc.status_code, len(_ERROR_TIERS) - 1)
+    code_tier = _CODE_TIERS.get(code)
+    if code_tier is None and code.startswith("errorinvalid"):
+        code_tier = 4
+    if code_tier is not None and code_tier < tier:
+        tier = code_tier
+    error_type, default_message = _ERROR_TIERS[tier]
+    message = fallback_message or default_message or exc.message
 
     payload: dict[str, Any] = {
         "error": message,
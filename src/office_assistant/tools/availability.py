@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from mcp.server.fastmcp import Context
@@ -18,14 +19,28 @@ from office_assistant.tools._helpers import (
     validate_timezone,
 )
 
-# Microsoft Graph encodes each availability slot as a single character.
-_AVAILABILITY_CODES: dict[str, str] = {
-    "0": "free",
-    "1": "tentative",
-    "2": "busy",
-    "3": "out_of_office",
-    "4": "working_elsewhere",
-}
+# Microsoft Graph encodes each availability slot as a single digit
+# ("0".."4"); index the tuple by ord(ch) - 48 to decode it.
+_AVAILABILITY_CODES: tuple[str, ...] = (
+    "free",
+    "tentative",
+    "busy",
+    "out_of_office",
+    "working_elsewhere",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_availability(view: str) -> tuple[str, ...]:
+    """Decode an availabilityView string into slot status names.
+
+    Cached per unique view string: attendees in the same request often
+    share a view (e.g. everyone free), so repeats cost a dict lookup
+    instead of a per-character loop.
+    """
+    return tuple(
+        _AVAILABILITY_CODES[ord(ch) - 48] if "0" <= ch <= "4" else "unknown" for ch in view
+    )
 
 
 @mcp.tool()
@@ -99,20 +114,24 @@ async def get_free_busy(
 
     results = []
     for schedule in data.get("value", []):
-        items = [
-            {
-                "status": item.get("status"),
-                "subject": item.get("subject"),
-                "start": item.get("start", {}).get("dateTime"),
-                "end": item.get("end", {}).get("dateTime"),
-            }
-            for item in schedule.get("scheduleItems", [])
-        ]
+        items = []
+        for item in schedule.get("scheduleItems", []):
+            # Bind the nested dicts once instead of re-walking the chain
+            # per field.
+            start = item.get("start") or {}
+            end = item.get("end") or {}
+            items.append(
+                {
+                    "status": item.get("status"),
+                    "subject": item.get("subject"),
+                    "start": start.get("dateTime"),
+                    "end": end.get("dateTime"),
+                }
+            )
 
         # availabilityView is a string like "0022200000" where each char
         # maps to a slot status via _AVAILABILITY_CODES.
-        availability_view = schedule.get("availabilityView", "")
-        slot_summary = [_AVAILABILITY_CODES.get(ch, "unknown") for ch in availability_view]
+        slot_summary = list(_decode_availability(schedule.get("availabilityView", "")))
 
         results.append(
             {
@@ -222,20 +241,25 @@ async def find_meeting_times(
 
     suggestions = []
     for suggestion in data.get("meetingTimeSuggestions", []):
-        slot = suggestion.get("meetingTimeSlot", {})
-        attendee_availability = [
-            {
-                "email": (att.get("attendee", {}).get("emailAddress", {}).get("address")),
-                "availability": att.get("availability"),
-            }
-            for att in suggestion.get("attendeeAvailability", [])
-        ]
+        slot = suggestion.get("meetingTimeSlot") or {}
+        slot_start = slot.get("start") or {}
+        slot_end = slot.get("end") or {}
+        attendee_availability = []
+        for att in suggestion.get("attendeeAvailability", []):
+            attendee = att.get("attendee") or {}
+            email_address = attendee.get("emailAddress") or {}
+            attendee_availability.append(
+                {
+                    "email": email_address.get("address"),
+                    "availability": att.get("availability"),
+                }
+            )
 
         suggestions.append(
             {
-                "start": slot.get("start", {}).get("dateTime"),
-                "end": slot.get("end", {}).get("dateTime"),
-                "timezone": slot.get("start", {}).get("timeZone"),
+                "start": slot_start.get("dateTime"),
+                "end": slot_end.get("dateTime"),
+                "timezone": slot_start.get("timeZone"),
                 "confidence": suggestion.get("confidence"),
                 "attendeeAvailability": attendee_availability,
                 "suggestionReason": suggestion.get("suggestionReason"),
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-import re
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 from mcp.server.fastmcp import Context
 
 from office_assistant.app import mcp
 from office_assistant.auth import AuthenticationRequired
-from office_assistant.graph_client import GraphApiError
+from office_assistant.graph_client import GraphApiError, GraphClient
 from office_assistant.tools._helpers import (
+    _is_valid_email,
     auth_required_response,
     get_graph,
     graph_error_response,
@@ -20,60 +25,146 @@ from office_assistant.tools._helpers import (
     validate_timezone,
 )
 
+# Graph returns at most this many calendarView items per page, and
+# accepts at most 20 sub-requests per $batch call.
+_PAGE_SIZE = 50
+_BATCH_LIMIT = 20
+_MAX_EVENTS = 1000
+
 # Fields to request from the Graph API when listing events.
 _EVENT_FIELDS = (
     "id,subject,start,end,location,isOnlineMeeting,onlineMeetingUrl,"
     "organizer,attendees,bodyPreview,isCancelled,showAs,isAllDay,recurrence"
 )
 
-_VALID_DAYS = {
-    "sunday",
-    "monday",
-    "tuesday",
-    "wednesday",
-    "thursday",
-    "friday",
-    "saturday",
-}
+_VALID_DAYS = frozenset(
+    {
+        "sunday",
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+    }
+)
 
-_VALID_PATTERN_TYPES = {
-    "daily",
-    "weekly",
-}
+_VALID_PATTERN_TYPES = frozenset({"daily", "weekly"})
+# Error-message fragments, sorted and joined once at import instead of
+# per rejected call.
+_VALID_PATTERN_TYPES_MSG = ", ".join(sorted(_VALID_PATTERN_TYPES))
+
+# Shared read-only fallback for missing nested objects; saves allocating
+# a throwaway {} per .get() miss in the formatting hot path.
+_EMPTY: dict[str, Any] = {}
 
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# Literal fragments of Graph request bodies, named once.
+_ATTENDEE_REQUIRED = "required"
+_ATTENDEE_RESOURCE = "resource"
+_CONTENT_TYPE_TEXT = "text"
+_TEAMS_PROVIDER = "teamsForBusiness"
 
 _RESPONSE_ENDPOINTS = {
     "accept": "accept",
     "decline": "decline",
     "tentatively_accept": "tentativelyAccept",
 }
+_VALID_RESPONSES_MSG = ", ".join(sorted(_RESPONSE_ENDPOINTS))
+
+# Short-lived cache of event start/end dicts, fed by list_events, so
+# update_event's fill-in fetch usually skips a Graph round-trip.  The
+# short TTL bounds how long an edit made elsewhere can go unnoticed.
+_EVENT_TIMES_TTL_SECONDS = 60.0
+_EVENT_TIMES_MAX = 512
+_event_times: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _remember_event_times(event: dict[str, Any]) -> None:
+    """Record an event's start/end for later partial updates."""
+    event_id = event.get("id")
+    start = event.get("start")
+    end = event.get("end")
+    if not (event_id and start and end):
+        return
+    _event_times[event_id] = (time.monotonic(), {"start": start, "end": end})
+    _event_times.move_to_end(event_id)
+    while len(_event_times) > _EVENT_TIMES_MAX:
+        _event_times.popitem(last=False)
+
+
+def _cached_event_times(event_id: str) -> dict[str, Any] | None:
+    """Return cached start/end for *event_id*, or None if missing/expired."""
+    entry = _event_times.get(event_id)
+    if entry is None:
+        return None
+    stamp, times = entry
+    if time.monotonic() - stamp > _EVENT_TIMES_TTL_SECONDS:
+        del _event_times[event_id]
+        return None
+    return times
+
+
+def _forget_event_times(event_id: str) -> None:
+    """Drop a cache entry after a mutation changes (or removes) the event."""
+    _event_times.pop(event_id, None)
+
+
+# Formatted-event cache keyed by (id, etag): agents list overlapping
+# windows ("today", then "this week"), and an unchanged etag means the
+# formatted output is identical.  Keying on the etag makes invalidation
+# automatic — any edit changes it.
+_FORMAT_CACHE_MAX = 1024
+_format_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+
+def _format_event_cached(event: dict[str, Any]) -> dict[str, Any]:
+    """Format *event*, reusing the cached result while its etag holds."""
+    event_id = event.get("id")
+    etag = event.get("@odata.etag")
+    if not event_id or not etag:
+        return _format_event(event)
+    key = (event_id, etag)
+    cached = _format_cache.get(key)
+    if cached is None:
+        cached = _format_event(event)
+        _format_cache[key] = cached
+        while len(_format_cache) > _FORMAT_CACHE_MAX:
+            _format_cache.popitem(last=False)
+    else:
+        _format_cache.move_to_end(key)
+    return cached
 
 
 def _format_event(event: dict[str, Any]) -> dict[str, Any]:
     """Extract the useful fields from a Graph API event object."""
-    attendees = [
-        {
-            "name": att.get("emailAddress", {}).get("name"),
-            "email": att.get("emailAddress", {}).get("address"),
-            "type": att.get("type"),
-            "status": att.get("status", {}).get("response"),
-        }
-        for att in event.get("attendees", [])
-    ]
+    attendees = []
+    for att in event.get("attendees", []):
+        email_address = att.get("emailAddress") or _EMPTY
+        status = att.get("status") or _EMPTY
+        attendees.append(
+            {
+                "name": email_address.get("name"),
+                "email": email_address.get("address"),
+                "type": att.get("type"),
+                "status": status.get("response"),
+            }
+        )
 
+    organizer_email_address = (event.get("organizer") or _EMPTY).get("emailAddress") or _EMPTY
+    start = event.get("start") or _EMPTY
+    end = event.get("end") or _EMPTY
     result: dict[str, Any] = {
         "id": event.get("id"),
         "subject": event.get("subject"),
-        "start": event.get("start", {}).get("dateTime"),
-        "startTimezone": event.get("start", {}).get("timeZone"),
-        "end": event.get("end", {}).get("dateTime"),
-        "endTimezone": event.get("end", {}).get("timeZone"),
-        "location": event.get("location", {}).get("displayName"),
+        "start": start.get("dateTime"),
+        "startTimezone": start.get("timeZone"),
+        "end": end.get("dateTime"),
+        "endTimezone": end.get("timeZone"),
+        "location": (event.get("location") or _EMPTY).get("displayName"),
         "isOnlineMeeting": event.get("isOnlineMeeting", False),
         "onlineMeetingUrl": event.get("onlineMeetingUrl"),
-        "organizer": event.get("organizer", {}).get("emailAddress", {}).get("name"),
-        "organizerEmail": (event.get("organizer", {}).get("emailAddress", {}).get("address")),
+        "organizer": organizer_email_address.get("name"),
+        "organizerEmail": organizer_email_address.get("address"),
         "attendees": attendees,
         "bodyPreview": event.get("bodyPreview"),
         "isCancelled": event.get("isCancelled", False),
@@ -88,6 +179,28 @@ def _format_event(event: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def _is_yyyy_mm_dd(value: str) -> bool:
+    """Check the YYYY-MM-DD shape with plain string ops (no regex)."""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:].isdecimal()
+    )
+
+
+def _attendee_payload(email: str, attendee_type: str = _ATTENDEE_REQUIRED) -> dict[str, Any]:
+    """Build the Graph attendee object for *email*.
+
+    Deliberately returns a fresh dict per call: the payloads are mutable
+    and short-lived, so caching them would trade an allocation for
+    aliasing bugs.
+    """
+    return {"emailAddress": {"address": email}, "type": attendee_type}
+
+
 def _is_access_denied(exc: GraphApiError) -> bool:
     if exc.status_code != 403:
         return False
@@ -95,8 +208,13 @@ def _is_access_denied(exc: GraphApiError) -> bool:
     return code in {"erroraccessdenied", "accessdenied"}
 
 
+@functools.lru_cache(maxsize=256)
 def _user_base(user_email: str | None) -> str:
-    """Build the Graph API path prefix for the target user."""
+    """Build the Graph API path prefix for the target user.
+
+    Cached: agents query the same few colleagues repeatedly, and quote()
+    re-scans the string on every call.
+    """
     if user_email:
         return f"/users/{quote(user_email, safe='')}"
     return "/me"
@@ -133,7 +251,7 @@ def _build_recurrence(
     Returns the recurrence dict on success, or an error string on failure.
     """
     if pattern not in _VALID_PATTERN_TYPES:
-        return f"recurrence_pattern must be one of: {', '.join(sorted(_VALID_PATTERN_TYPES))}."
+        return f"recurrence_pattern must be one of: {_VALID_PATTERN_TYPES_MSG}."
     if end_date and count is not None:
         return "Provide either recurrence_end_date or recurrence_count, not both."
 
@@ -142,9 +260,10 @@ def _build_recurrence(
         return "recurrence_interval must be at least 1."
 
     if days_of_week:
-        lowered = [d.lower() for d in days_of_week]
-        invalid = [d for d in lowered if d not in _VALID_DAYS]
-        if invalid:
+        # Lowercase once, dedupe while preserving the caller's order
+        # (Graph keeps the list as given), and validate in the same pass.
+        lowered = list(dict.fromkeys(d.lower() for d in days_of_week))
+        if invalid := [d for d in lowered if d not in _VALID_DAYS]:
             return f"Invalid days of week: {', '.join(invalid)}."
     else:
         lowered = None
@@ -162,7 +281,7 @@ def _build_recurrence(
     # Determine range type from provided end conditions.
     start_date = start_datetime.split("T")[0]
     if end_date:
-        if not _DATE_RE.match(end_date):
+        if not _is_yyyy_mm_dd(end_date):
             return "recurrence_end_date must be in YYYY-MM-DD format."
         range_obj: dict[str, Any] = {
             "type": "endDate",
@@ -183,12 +302,44 @@ def _build_recurrence(
     return {"pattern": pattern_obj, "range": range_obj}
 
 
+async def _list_events_batched(
+    graph: GraphClient, base: str, params: dict[str, str], max_events: int
+) -> list[dict[str, Any]]:
+    """Fetch multiple calendarView pages in parallel via ``/$batch``.
+
+    Builds one GET per page using ``$skip`` offsets, so N sequential
+    nextLink round-trips collapse into ceil(N / 20) batch calls.
+    """
+    page_count = -(-max_events // _PAGE_SIZE)
+    requests = []
+    for page in range(page_count):
+        top = min(_PAGE_SIZE, max_events - page * _PAGE_SIZE)
+        query = urlencode({**params, "$top": str(top), "$skip": str(page * _PAGE_SIZE)})
+        requests.append({"method": "GET", "url": f"{base}/calendarview?{query}"})
+
+    items: list[dict[str, Any]] = []
+    for offset in range(0, len(requests), _BATCH_LIMIT):
+        for resp in await graph.batch(requests[offset : offset + _BATCH_LIMIT]):
+            status = resp.get("status", 0)
+            body = resp.get("body") or {}
+            if not 200 <= status < 300:
+                err = body.get("error") or {}
+                raise GraphApiError(
+                    status_code=status,
+                    code=err.get("code"),
+                    message=err.get("message") or f"HTTP {status}",
+                )
+            items.extend(body.get("value", []))
+    return items[:max_events]
+
+
 @mcp.tool()
 async def list_events(
     start_datetime: str,
     end_datetime: str,
     ctx: Context,
     user_email: str | None = None,
+    max_events: int | None = None,
 ) -> dict[str, Any]:
     """List calendar events for a date range.
 
@@ -200,11 +351,16 @@ async def list_events(
         user_email: Email address of another user whose calendar to view.
             Omit to view the authenticated user's calendar.
             Requires that the user has shared their calendar with you.
+        max_events: Maximum number of events to return (1-1000).  Counts
+            above one page are fetched as parallel $batch pages; omit for
+            the default paginated fetch.
     """
     if err := validate_datetime_order(start_datetime, end_datetime):
         return {"error": err}
     if user_email and (err := validate_emails([user_email])):
         return {"error": err}
+    if max_events is not None and not 1 <= max_events <= _MAX_EVENTS:
+        return {"error": f"max_events must be between 1 and {_MAX_EVENTS}."}
 
     graph = get_graph(ctx)
     base = _user_base(user_email)
@@ -217,7 +373,15 @@ async def list_events(
     }
 
     try:
-        data = await graph.get_all(f"{base}/calendarview", params=params)
+        if max_events is not None and max_events > _PAGE_SIZE:
+            raw_events = await _list_events_batched(graph, base, params, max_events)
+        else:
+            if max_events is not None:
+                params["$top"] = str(max_events)
+            data = await graph.get_all(f"{base}/calendarview", params=params)
+            raw_events = data.get("value", [])
+            if max_events is not None:
+                raw_events = raw_events[:max_events]
     except AuthenticationRequired as exc:
         return auth_required_response(exc)
     except GraphApiError as exc:
@@ -231,10 +395,86 @@ async def list_events(
             )
         return graph_error_response(exc)
 
-    events = [_format_event(ev) for ev in data.get("value", [])]
+    for ev in raw_events:
+        _remember_event_times(ev)
+    events = [_format_event_cached(ev) for ev in raw_events]
     return {"events": events, "count": len(events)}
 
 
+@mcp.tool()
+async def list_events_batch(targets: list[dict[str, Any]], ctx: Context) -> dict[str, Any]:
+    """List events for several calendars or date windows in one round-trip.
+
+    Each target is a dict with ``start_datetime`` and ``end_datetime``
+    (ISO 8601) plus an optional ``user_email``.  Up to 20 targets are
+    packed into each Graph ``/$batch`` call, so checking a whole team's
+    calendars costs one request instead of one per person.
+
+    Args:
+        targets: List of calendar windows to fetch.  Results come back
+            in the same order; each target succeeds or fails on its own.
+    """
+    if not targets:
+        return {"error": "At least one target is required."}
+
+    requests = []
+    for index, target in enumerate(targets):
+        start = target.get("start_datetime")
+        end = target.get("end_datetime")
+        user_email = target.get("user_email")
+        if not start or not end:
+            return {"error": f"targets[{index}] must include start_datetime and end_datetime."}
+        if err := validate_datetime_order(start, end):
+            return {"error": f"targets[{index}]: {err}"}
+        if user_email and (err := validate_emails([user_email])):
+            return {"error": f"targets[{index}]: {err}"}
+        query = urlencode(
+            {
+                "startDateTime": start,
+                "endDateTime": end,
+                "$orderby": "start/dateTime",
+                "$top": "50",
+                "$select": _EVENT_FIELDS,
+            }
+        )
+        requests.append({"method": "GET", "url": f"{_user_base(user_email)}/calendarview?{query}"})
+
+    graph = get_graph(ctx)
+    try:
+        responses: list[dict[str, Any]] = []
+        for offset in range(0, len(requests), _BATCH_LIMIT):
+            responses.extend(await graph.batch(requests[offset : offset + _BATCH_LIMIT]))
+    except AuthenticationRequired as exc:
+        return auth_required_response(exc)
+    except GraphApiError as exc:
+        return graph_error_response(exc)
+
+    results = []
+    for target, resp in zip(targets, responses, strict=True):
+        status = resp.get("status", 0)
+        body = resp.get("body") or {}
+        entry: dict[str, Any] = {"userEmail": target.get("user_email")}
+        if 200 <= status < 300:
+            raw_events = body.get("value", [])
+            for ev in raw_events:
+                _remember_event_times(ev)
+            entry["events"] = [_format_event_cached(ev) for ev in raw_events]
+            entry["count"] = len(raw_events)
+        else:
+            error_body = body.get("error") or {}
+            entry.update(
+                graph_error_response(
+                    GraphApiError(
+                        status_code=status,
+                        code=error_body.get("code"),
+                        message=error_body.get("message") or f"HTTP {status}",
+                    )
+                )
+            )
+        results.append(entry)
+    return {"results": results, "count": len(results)}
+
+
 @mcp.tool()
 async def create_event(
     subject: str,
@@ -287,13 +527,27 @@ async def create_event(
         recurrence_count: Stop after this many occurrences.
             Provide this OR recurrence_end_date, or omit both for no end.
     """
-    all_emails = list(attendees or [])
-    if room_emails and (err := validate_emails(room_emails)):
-        return {"error": err}
-    if all_emails and (err := validate_emails(all_emails)):
-        return {"error": err}
-    if user_email and (err := validate_emails([user_email])):
-        return {"error": err}
+    # One pass over every address: each unique email is validated once,
+    # and duplicates are dropped (Graph rejects an event that lists the
+    # same address twice; people take precedence over rooms).
+    seen: set[str] = set()
+    invalid: list[str] = []
+    unique_attendees: list[str] = []
+    unique_rooms: list[str] = []
+    for emails, bucket in ((attendees, unique_attendees), (room_emails, unique_rooms)):
+        for email in emails or ():
+            key = email.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            if _is_valid_email(email):
+                bucket.append(email)
+            elif len(invalid) < 3:
+                invalid.append(email)
+    if user_email and len(invalid) < 3 and not _is_valid_email(user_email):
+        invalid.append(user_email)
+    if invalid:
+        return {"error": f"Invalid email address(es): {', '.join(invalid)}"}
     if err := validate_timezone(start_timezone, "start_timezone"):
         return {"error": err}
     if err := validate_timezone(end_timezone, "end_timezone"):
@@ -319,23 +573,23 @@ async def create_event(
     # Personal accounts silently ignore isOnlineMeeting.
     event_body["isOnlineMeeting"] = is_online_meeting
     if is_online_meeting:
-        event_body["onlineMeetingProvider"] = "teamsForBusiness"
-
-    # Build attendees list: people as "required", rooms as "resource".
-    attendee_list: list[dict[str, Any]] = []
-    if attendees:
-        attendee_list.extend(
-            {"emailAddress": {"address": email}, "type": "required"} for email in attendees
-        )
-    if room_emails:
-        attendee_list.extend(
-            {"emailAddress": {"address": email}, "type": "resource"} for email in room_emails
+        event_body["onlineMeetingProvider"] = _TEAMS_PROVIDER
+
+    # Build attendees list: people as "required", rooms as "resource",
+    # in one comprehension (a single right-sized allocation).
+    attendee_list: list[dict[str, Any]] = [
+        _attendee_payload(email, attendee_type)
+        for emails, attendee_type in (
+            (unique_attendees, _ATTENDEE_REQUIRED),
+            (unique_rooms, _ATTENDEE_RESOURCE),
         )
+        for email in emails
+    ]
     if attendee_list:
         event_body["attendees"] = attendee_list
 
     if body:
-        event_body["body"] = {"contentType": "text", "content": body}
+        event_body["body"] = {"contentType": _CONTENT_TYPE_TEXT, "content": body}
 
     if location:
         event_body["location"] = {"displayName": location}
@@ -353,14 +607,11 @@ async def create_event(
         if isinstance(recurrence, str):
             return {"error": recurrence}
         event_body["recurrence"] = recurrence
-    elif any(
-        v is not None
-        for v in [
-            recurrence_interval,
-            recurrence_days_of_week,
-            recurrence_end_date,
-            recurrence_count,
-        ]
+    elif (
+        recurrence_interval is not None
+        or recurrence_days_of_week is not None
+        or recurrence_end_date is not None
+        or recurrence_count is not None
     ):
         return {
             "error": "recurrence_pattern is required when any recurrence parameter is provided."
@@ -409,6 +660,21 @@ async def update_event(
         user_email: Update an event on another user's calendar
             (requires delegate access, work/school accounts only).
     """
+    # Reject the degenerate empty patch before any validation or I/O —
+    # no point fetching the existing event just to find nothing changes.
+    if (
+        subject is None
+        and start_datetime is None
+        and start_timezone is None
+        and end_datetime is None
+        and end_timezone is None
+        and attendees is None
+        and body is None
+        and location is None
+        and is_online_meeting is None
+    ):
+        return {"error": "No fields to update. Provide at least one field to change."}
+
     if attendees is not None and (err := validate_emails(attendees)):
         return {"error": err}
     if user_email and (err := validate_emails([user_email])):
@@ -433,14 +699,18 @@ async def update_event(
     )
     existing: dict[str, Any] = {}
     if need_existing:
-        try:
-            existing = await graph.get(
-                _event_path(base, event_id), params={"$select": "start,end"}
-            )
-        except AuthenticationRequired as exc:
-            return auth_required_response(exc)
-        except GraphApiError as exc:
-            return _delegate_error(exc, user_email)
+        cached = _cached_event_times(event_id)
+        if cached is not None:
+            existing = cached
+        else:
+            try:
+                existing = await graph.get(
+                    _event_path(base, event_id), params={"$select": "start,end"}
+                )
+            except AuthenticationRequired as exc:
+                return auth_required_response(exc)
+            except GraphApiError as exc:
+                return _delegate_error(exc, user_email)
 
     updates: dict[str, Any] = {}
     if subject is not None:
@@ -456,17 +726,15 @@ async def update_event(
         if dt and tz:
             updates["end"] = {"dateTime": dt, "timeZone": tz}
     if attendees is not None:
-        updates["attendees"] = [
-            {"emailAddress": {"address": email}, "type": "required"} for email in attendees
-        ]
+        updates["attendees"] = [_attendee_payload(email) for email in attendees]
     if body is not None:
-        updates["body"] = {"contentType": "text", "content": body}
+        updates["body"] = {"contentType": _CONTENT_TYPE_TEXT, "content": body}
     if location is not None:
         updates["location"] = {"displayName": location}
     if is_online_meeting is not None:
         updates["isOnlineMeeting"] = is_online_meeting
         if is_online_meeting:
-            updates["onlineMeetingProvider"] = "teamsForBusiness"
+            updates["onlineMeetingProvider"] = _TEAMS_PROVIDER
 
     if not updates:
         return {"error": "No fields to update. Provide at least one field to change."}
@@ -491,9 +759,74 @@ async def update_event(
         return auth_required_response(exc)
     except GraphApiError as exc:
         return _delegate_error(exc, user_email)
+    _forget_event_times(event_id)
     return _format_event(data)
 
 
+@mcp.tool()
+async def add_attendees(
+    event_id: str,
+    emails: list[str],
+    ctx: Context,
+    user_email: str | None = None,
+) -> dict[str, Any]:
+    """Add attendees to an existing event without replacing the list.
+
+    Graph's PATCH semantics replace the whole attendees collection, so
+    adding one person normally means re-sending everyone.  This tool
+    reads the current list, appends the new addresses (skipping any
+    already invited), and sends the merged list in one update.
+
+    Args:
+        event_id: The ID of the event to modify (from list_events).
+        emails: Email addresses to add as required attendees.
+        user_email: Modify an event on another user's calendar
+            (requires delegate access, work/school accounts only).
+    """
+    if not emails:
+        return {"error": "At least one email address is required."}
+    if err := validate_emails(emails):
+        return {"error": err}
+    if user_email and (err := validate_emails([user_email])):
+        return {"error": err}
+
+    graph = get_graph(ctx)
+    base = _user_base(user_email)
+
+    try:
+        existing = await graph.get(_event_path(base, event_id), params={"$select": "attendees"})
+    except AuthenticationRequired as exc:
+        return auth_required_response(exc)
+    except GraphApiError as exc:
+        return _delegate_error(exc, user_email)
+
+    attendee_list = list(existing.get("attendees") or [])
+    present = {
+        (att.get("emailAddress") or _EMPTY).get("address", "").lower() for att in attendee_list
+    }
+    added: list[str] = []
+    for email in emails:
+        lowered = email.lower()
+        if lowered not in present:
+            attendee_list.append(_attendee_payload(email))
+            present.add(lowered)
+            added.append(email)
+
+    if not added:
+        return {"status": "unchanged", "event_id": event_id, "addedAttendees": []}
+
+    try:
+        data = await graph.patch(_event_path(base, event_id), json={"attendees": attendee_list})
+    except AuthenticationRequired as exc:
+        return auth_required_response(exc)
+    except GraphApiError as exc:
+        return _delegate_error(exc, user_email)
+
+    result = _format_event(data)
+    result["addedAttendees"] = added
+    return result
+
+
 @mcp.tool()
 async def cancel_event(
     event_id: str,
@@ -535,6 +868,7 @@ async def cancel_event(
         except GraphApiError as exc:
             return _delegate_error(exc, user_email)
 
+    _forget_event_times(event_id)
     return {"status": "cancelled", "event_id": event_id}
 
 
@@ -563,8 +897,7 @@ async def respond_to_event(
 
     endpoint = _RESPONSE_ENDPOINTS.get(response)
     if not endpoint:
-        valid = ", ".join(sorted(_RESPONSE_ENDPOINTS))
-        return {"error": f"response must be one of: {valid}."}
+        return {"error": f"response must be one of: {_VALID_RESPONSES_MSG}."}
 
     graph = get_graph(ctx)
     base = _user_base(user_email)
@@ -597,3 +930,46 @@ async def respond_to_event(
         return graph_error_response(exc)
 
     return {"status": "responded", "event_id": event_id, "response": response}
+
+
+# Dispatch table for bulk_event_ops; defined after the tools it wraps.
+_BULK_OPS: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {
+    "add_attendees": add_attendees,
+    "create": create_event,
+    "update": update_event,
+    "cancel": cancel_event,
+    "respond": respond_to_event,
+}
+_BULK_OPS_MSG = ", ".join(sorted(_BULK_OPS))
+
+
+@mcp.tool()
+async def bulk_event_ops(ops: list[dict[str, Any]], ctx: Context) -> dict[str, Any]:
+    """Run several independent event operations concurrently.
+
+    Each operation is a dict with a ``kind`` of "add_attendees",
+    "create", "update", "cancel", or "respond", plus that tool's own
+    arguments (for example ``{"kind": "cancel", "event_id": "..."}``).
+    Operations run in
+    parallel, so N mutations cost roughly one round-trip instead of N.
+
+    Args:
+        ops: List of operations to perform.  Results are returned in the
+            same order; each entry succeeds or fails independently.
+    """
+    if not ops:
+        return {"error": "At least one operation is required."}
+
+    async def _run(op: dict[str, Any]) -> dict[str, Any]:
+        kind = op.get("kind", "")
+        tool = _BULK_OPS.get(kind)
+        if tool is None:
+            return {"error": f"kind must be one of: {_BULK_OPS_MSG}."}
+        kwargs = {key: value for key, value in op.items() if key != "kind"}
+        try:
+            return await tool(ctx=ctx, **kwargs)
+        except TypeError as exc:
+            return {"error": f"Invalid arguments for {kind}: {exc}"}
+
+    results = await asyncio.gather(*(_run(op) for op in ops))
+    return {"results": results, "count": len(results)}
@@ -8,7 +8,7 @@ from mcp.server.fastmcp import Context
 
 from office_assistant.app import mcp
 from office_assistant.auth import AuthenticationRequired
-from office_assistant.graph_client import GraphApiError
+from office_assistant.graph_client import GraphApiError, GraphClient
 from office_assistant.tools._helpers import (
     auth_required_response,
     get_graph,
@@ -16,6 +16,29 @@ from office_assistant.tools._helpers import (
 )
 
 
+async def _fetch_rooms(graph: GraphClient, building: str | None) -> dict[str, Any]:
+    """Fetch rooms, filtering by building server-side when possible.
+
+    Pushing the substring match into a ``$filter`` avoids transferring
+    every page of rooms when only one building is wanted.  Support for
+    ``$filter`` on the rooms endpoint varies by tenant, so a 400 on the
+    filtered request falls back to fetching everything (the caller's
+    client-side filter still applies).
+    """
+    params = {"$top": "100"}
+    if building:
+        # Single quotes in OData string literals are escaped by doubling.
+        escaped = building.lower().replace("'", "''")
+        params["$filter"] = f"contains(tolower(building), '{escaped}')"
+        try:
+            return await graph.get_all("/places/microsoft.graph.room", params=params)
+        except GraphApiError as exc:
+            if exc.status_code != 400:
+                raise
+            del params["$filter"]
+    return await graph.get_all("/places/microsoft.graph.room", params=params)
+
+
 @mcp.tool()
 async def list_rooms(
     ctx: Context,
@@ -34,7 +57,7 @@ async def list_rooms(
     graph = get_graph(ctx)
 
     try:
-        data = await graph.get_all("/places/microsoft.graph.room", params={"$top": "100"})
+        data = await _fetch_rooms(graph, building)
     except AuthenticationRequired as exc:
         return auth_required_response(exc)
     except GraphApiError as exc:
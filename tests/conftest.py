@@ -16,6 +16,7 @@ def mock_graph():
     client.get = AsyncMock()
     client.get_all = AsyncMock()
     client.post = AsyncMock()
+    client.batch = AsyncMock()
     client.patch = AsyncMock()
     client.delete = AsyncMock()
     return client
@@ -29,6 +30,34 @@ def mock_ctx(mock_graph):
     return ctx
 
 
+@pytest.fixture(autouse=True)
+def reset_auth_singletons():
+    """Drop the process-wide MSAL application between tests.
+
+    get_token() caches the PublicClientApplication per process; tests that
+    patch msal need each test to start from a clean slate.
+    """
+    from office_assistant import auth
+
+    auth._reset_app()
+    auth._dotenv_config.cache_clear()
+    yield
+    auth._reset_app()
+    auth._dotenv_config.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_event_caches():
+    """Clear the events module's in-process caches between tests."""
+    from office_assistant.tools import events
+
+    events._event_times.clear()
+    events._format_cache.clear()
+    yield
+    events._event_times.clear()
+    events._format_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def patch_auth():
     """Prevent real auth calls during tests.
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -54,6 +56,24 @@ class TestTokenCache:
         assert cache_dir.exists()
         assert json.loads(cache_file.read_text()) == {"token": "data"}
 
+    def test_save_cache_recreates_removed_dir(self, tmp_path):
+        """A cache dir deleted mid-session is recreated on the next save."""
+        cache_dir = tmp_path / "new_dir"
+        cache_file = cache_dir / "token_cache.json"
+        mock_cache = MagicMock()
+        mock_cache.has_state_changed = True
+        mock_cache.serialize.side_effect = ['{"token": "one"}', '{"token": "two"}']
+
+        with (
+            patch("office_assistant.auth.CACHE_DIR", cache_dir),
+            patch("office_assistant.auth.CACHE_FILE", cache_file),
+        ):
+            _save_cache(mock_cache)
+            shutil.rmtree(cache_dir)
+            _save_cache(mock_cache)
+
+        assert json.loads(cache_file.read_text()) == {"token": "two"}
+
     def test_save_cache_skips_when_no_change(self, tmp_path):
         cache_file = tmp_path / "token_cache.json"
         mock_cache = MagicMock()
@@ -110,6 +130,16 @@ class TestLoadEnv:
             assert client_id == "env-client"
             assert tenant_id == "env-tenant"
 
+    def test_rewritten_dotenv_is_picked_up(self, tmp_path):
+        """A rewritten .env (new mtime) is reparsed without a cache clear."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CLIENT_ID=old\nTENANT_ID=xyz\n")
+        with patch.dict("os.environ", {"DOTENV_PATH": str(env_file)}):
+            assert _load_env()[0] == "old"
+            env_file.write_text("CLIENT_ID=new\nTENANT_ID=xyz\n")
+            os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000))
+            assert _load_env()[0] == "new"
+
     def test_loads_from_process_env_without_dotenv(self):
         with patch.dict(
             "os.environ",
@@ -190,3 +220,63 @@ class TestGetToken:
                     get_token()
             finally:
                 patch_auth.start()
+
+    def test_application_reused_across_calls(self, patch_auth):
+        """The PublicClientApplication is built once and reused per process."""
+        mock_app = MagicMock()
+        mock_app.get_accounts.return_value = [{"username": "user@test.com"}]
+        mock_app.acquire_token_silent.return_value = {"access_token": "cached-token"}
+
+        with (
+            patch("office_assistant.auth._load_env", return_value=("client-id", "tenant-id")),
+            patch("office_assistant.auth._build_cache"),
+            patch("office_assistant.auth._save_cache"),
+            patch("msal.PublicClientApplication", return_value=mock_app) as mock_pca,
+        ):
+            patch_auth.stop()
+            try:
+                assert get_token() == "cached-token"
+                assert get_token() == "cached-token"
+            finally:
+                patch_auth.start()
+
+        assert mock_pca.call_count == 1
+
+
+class TestSaveCacheWrites:
+    def test_save_cache_skips_identical_bytes(self, tmp_path):
+        """A second save of the same serialized payload doesn't rewrite the file."""
+        cache_dir = tmp_path / "dir"
+        cache_file = cache_dir / "token_cache.json"
+        mock_cache = MagicMock()
+        mock_cache.has_state_changed = True
+        mock_cache.serialize.return_value = '{"token": "data"}'
+
+        with (
+            patch("office_assistant.auth.CACHE_DIR", cache_dir),
+            patch("office_assistant.auth.CACHE_FILE", cache_file),
+        ):
+            _save_cache(mock_cache)
+            first_mtime = cache_file.stat().st_mtime_ns
+            cache_file.write_text('{"token": "data"}')  # reset mtime marker
+            mtime_after_touch = cache_file.stat().st_mtime_ns
+            _save_cache(mock_cache)
+            assert cache_file.stat().st_mtime_ns == mtime_after_touch
+
+        assert first_mtime is not None
+
+    def test_save_cache_leaves_no_temp_file(self, tmp_path):
+        cache_dir = tmp_path / "dir"
+        cache_file = cache_dir / "token_cache.json"
+        mock_cache = MagicMock()
+        mock_cache.has_state_changed = True
+        mock_cache.serialize.return_value = '{"token": "data"}'
+
+        with (
+            patch("office_assistant.auth.CACHE_DIR", cache_dir),
+            patch("office_assistant.auth.CACHE_FILE", cache_file),
+        ):
+            _save_cache(mock_cache)
+
+        assert json.loads(cache_file.read_text()) == {"token": "data"}
+        assert list(cache_dir.iterdir()) == [cache_file]
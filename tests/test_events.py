@@ -6,9 +6,12 @@ import pytest
 
 from office_assistant.graph_client import GraphApiError
 from office_assistant.tools.events import (
+    add_attendees,
+    bulk_event_ops,
     cancel_event,
     create_event,
     list_events,
+    list_events_batch,
     respond_to_event,
     update_event,
 )
@@ -100,6 +103,74 @@ class TestListEvents:
         assert "permission" in result["error"].lower()
         assert result["errorType"] == "permission_denied"
 
+    @pytest.mark.asyncio
+    async def test_max_events_over_one_page_uses_batch(self, mock_ctx, mock_graph):
+        mock_graph.batch.return_value = [
+            {"id": "0", "status": 200, "body": {"value": [SAMPLE_EVENT]}},
+            {"id": "1", "status": 200, "body": {"value": []}},
+        ]
+
+        result = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-20T23:59:59",
+            ctx=mock_ctx,
+            max_events=100,
+        )
+
+        assert result["count"] == 1
+        mock_graph.get_all.assert_not_called()
+        sub_requests = mock_graph.batch.call_args[0][0]
+        assert len(sub_requests) == 2
+        assert "%24skip=50" in sub_requests[1]["url"]
+
+    @pytest.mark.asyncio
+    async def test_max_events_batch_sub_request_failure(self, mock_ctx, mock_graph):
+        mock_graph.batch.return_value = [
+            {"id": "0", "status": 200, "body": {"value": [SAMPLE_EVENT]}},
+            {
+                "id": "1",
+                "status": 403,
+                "body": {"error": {"code": "ErrorAccessDenied", "message": "Forbidden"}},
+            },
+        ]
+
+        result = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-20T23:59:59",
+            ctx=mock_ctx,
+            max_events=100,
+        )
+
+        assert result["errorType"] == "permission_denied"
+
+    @pytest.mark.asyncio
+    async def test_max_events_out_of_range_rejected(self, mock_ctx, mock_graph):
+        result = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+            max_events=0,
+        )
+
+        assert "error" in result
+        assert "max_events" in result["error"]
+        mock_graph.get_all.assert_not_called()
+        mock_graph.batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_max_events_caps_page_size(self, mock_ctx, mock_graph):
+        mock_graph.get_all.return_value = {"value": [SAMPLE_EVENT]}
+
+        await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+            max_events=10,
+        )
+
+        params = mock_graph.get_all.call_args.kwargs["params"]
+        assert params["$top"] == "10"
+
     @pytest.mark.asyncio
     async def test_invalid_datetime_range_rejected(self, mock_ctx, mock_graph):
         result = await list_events(
@@ -210,6 +281,29 @@ class TestCreateEvent:
         assert body["attendees"][1]["type"] == "resource"
         assert body["attendees"][1]["emailAddress"]["address"] == "room-a@company.com"
 
+    @pytest.mark.asyncio
+    async def test_create_dedupes_attendees_and_rooms(self, mock_ctx, mock_graph):
+        """Duplicate addresses across attendees and rooms are sent once."""
+        mock_graph.post.return_value = SAMPLE_EVENT
+
+        await create_event(
+            subject="Board Meeting",
+            start_datetime="2026-02-17T14:00:00",
+            start_timezone="Europe/London",
+            end_datetime="2026-02-17T15:00:00",
+            end_timezone="Europe/London",
+            ctx=mock_ctx,
+            attendees=["alice@company.com", "Alice@company.com"],
+            room_emails=["room-a@company.com", "alice@company.com"],
+        )
+
+        body = mock_graph.post.call_args[1]["json"]
+        assert len(body["attendees"]) == 2
+        assert [a["emailAddress"]["address"] for a in body["attendees"]] == [
+            "alice@company.com",
+            "room-a@company.com",
+        ]
+
 
 class TestRecurrence:
     @pytest.mark.asyncio
@@ -643,6 +737,7 @@ class TestUpdateEvent:
         result = await update_event(event_id="event-1", ctx=mock_ctx)
         assert "error" in result
         mock_graph.patch.assert_not_called()
+        mock_graph.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_time(self, mock_ctx, mock_graph):
@@ -761,6 +856,62 @@ class TestUpdateEvent:
         mock_graph.patch.assert_not_called()
 
 
+class TestEventTimesCache:
+    @pytest.mark.asyncio
+    async def test_partial_update_uses_times_from_list_events(self, mock_ctx, mock_graph):
+        mock_graph.get_all.return_value = {"value": [SAMPLE_EVENT]}
+        mock_graph.patch.return_value = SAMPLE_EVENT
+        await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+
+        result = await update_event(
+            event_id="event-1",
+            ctx=mock_ctx,
+            start_datetime="2026-02-16T09:05:00",
+            start_timezone="Europe/London",
+        )
+
+        assert "error" not in result
+        mock_graph.get.assert_not_called()
+        updates = mock_graph.patch.call_args.kwargs["json"]
+        # Ordering was validated against the cached end, not a fresh GET.
+        assert updates["start"]["dateTime"] == "2026-02-16T09:05:00"
+        assert "end" not in updates
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cached_times(self, mock_ctx, mock_graph):
+        mock_graph.get_all.return_value = {"value": [SAMPLE_EVENT]}
+        mock_graph.patch.return_value = SAMPLE_EVENT
+        mock_graph.get.return_value = {
+            "start": {"dateTime": "2026-02-16T09:00:00", "timeZone": "Europe/London"},
+            "end": {"dateTime": "2026-02-16T09:30:00", "timeZone": "Europe/London"},
+        }
+        await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+
+        await update_event(
+            event_id="event-1",
+            ctx=mock_ctx,
+            start_datetime="2026-02-16T09:05:00",
+            start_timezone="Europe/London",
+        )
+        # Second partial update must re-fetch: the PATCH changed the times.
+        await update_event(
+            event_id="event-1",
+            ctx=mock_ctx,
+            start_datetime="2026-02-16T09:10:00",
+            start_timezone="Europe/London",
+        )
+
+        mock_graph.get.assert_called_once()
+
+
 class TestCancelEvent:
     @pytest.mark.asyncio
     async def test_cancel_without_comment(self, mock_ctx, mock_graph):
@@ -1213,3 +1364,206 @@ class TestIsAccessDenied:
         assert "error" in result
         # Should be a generic error, not the delegate-specific message
         assert "permission to respond" not in result.get("error", "")
+
+
+class TestListEventsBatch:
+    @pytest.mark.asyncio
+    async def test_fetches_multiple_calendars_in_one_batch(self, mock_ctx, mock_graph):
+        mock_graph.batch.return_value = [
+            {"id": "0", "status": 200, "body": {"value": [SAMPLE_EVENT]}},
+            {"id": "1", "status": 200, "body": {"value": []}},
+        ]
+
+        result = await list_events_batch(
+            targets=[
+                {
+                    "start_datetime": "2026-02-16T00:00:00",
+                    "end_datetime": "2026-02-16T23:59:59",
+                },
+                {
+                    "start_datetime": "2026-02-16T00:00:00",
+                    "end_datetime": "2026-02-16T23:59:59",
+                    "user_email": "bob@company.com",
+                },
+            ],
+            ctx=mock_ctx,
+        )
+
+        assert result["count"] == 2
+        assert result["results"][0]["events"][0]["subject"] == "Team Standup"
+        assert result["results"][1]["userEmail"] == "bob@company.com"
+        sub_requests = mock_graph.batch.call_args[0][0]
+        assert sub_requests[0]["url"].startswith("/me/calendarview?")
+        assert sub_requests[1]["url"].startswith("/users/bob%40company.com/calendarview?")
+
+    @pytest.mark.asyncio
+    async def test_per_target_failures_are_isolated(self, mock_ctx, mock_graph):
+        mock_graph.batch.return_value = [
+            {"id": "0", "status": 200, "body": {"value": [SAMPLE_EVENT]}},
+            {
+                "id": "1",
+                "status": 403,
+                "body": {"error": {"code": "ErrorAccessDenied", "message": "Forbidden"}},
+            },
+        ]
+
+        result = await list_events_batch(
+            targets=[
+                {
+                    "start_datetime": "2026-02-16T00:00:00",
+                    "end_datetime": "2026-02-16T23:59:59",
+                },
+                {
+                    "start_datetime": "2026-02-16T00:00:00",
+                    "end_datetime": "2026-02-16T23:59:59",
+                    "user_email": "secret@company.com",
+                },
+            ],
+            ctx=mock_ctx,
+        )
+
+        assert result["results"][0]["count"] == 1
+        assert result["results"][1]["errorType"] == "permission_denied"
+
+    @pytest.mark.asyncio
+    async def test_invalid_target_rejected_before_any_io(self, mock_ctx, mock_graph):
+        result = await list_events_batch(
+            targets=[{"start_datetime": "2026-02-16T00:00:00"}],
+            ctx=mock_ctx,
+        )
+
+        assert "targets[0]" in result["error"]
+        mock_graph.batch.assert_not_called()
+
+
+class TestAddAttendees:
+    @pytest.mark.asyncio
+    async def test_appends_to_existing_attendees(self, mock_ctx, mock_graph):
+        mock_graph.get.return_value = {
+            "attendees": [{"emailAddress": {"address": "bob@company.com"}, "type": "required"}]
+        }
+        mock_graph.patch.return_value = SAMPLE_EVENT
+
+        result = await add_attendees(
+            event_id="event-1",
+            emails=["carol@company.com"],
+            ctx=mock_ctx,
+        )
+
+        assert result["addedAttendees"] == ["carol@company.com"]
+        sent = mock_graph.patch.call_args.kwargs["json"]["attendees"]
+        addresses = [att["emailAddress"]["address"] for att in sent]
+        assert addresses == ["bob@company.com", "carol@company.com"]
+
+    @pytest.mark.asyncio
+    async def test_already_invited_is_a_no_op(self, mock_ctx, mock_graph):
+        mock_graph.get.return_value = {
+            "attendees": [{"emailAddress": {"address": "bob@company.com"}, "type": "required"}]
+        }
+
+        result = await add_attendees(
+            event_id="event-1",
+            emails=["Bob@Company.com"],
+            ctx=mock_ctx,
+        )
+
+        assert result["status"] == "unchanged"
+        mock_graph.patch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_email_rejected(self, mock_ctx, mock_graph):
+        result = await add_attendees(
+            event_id="event-1",
+            emails=["not-an-email"],
+            ctx=mock_ctx,
+        )
+
+        assert "Invalid email" in result["error"]
+        mock_graph.get.assert_not_called()
+
+
+class TestFormatCache:
+    @pytest.mark.asyncio
+    async def test_unchanged_etag_reuses_formatted_event(self, mock_ctx, mock_graph):
+        event = {**SAMPLE_EVENT, "@odata.etag": 'W/"v1"'}
+        mock_graph.get_all.return_value = {"value": [event]}
+
+        first = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+        second = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+
+        assert first["events"][0] is second["events"][0]
+
+    @pytest.mark.asyncio
+    async def test_changed_etag_reformats(self, mock_ctx, mock_graph):
+        mock_graph.get_all.side_effect = [
+            {"value": [{**SAMPLE_EVENT, "@odata.etag": 'W/"v1"'}]},
+            {"value": [{**SAMPLE_EVENT, "@odata.etag": 'W/"v2"', "subject": "Renamed"}]},
+        ]
+
+        await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+        second = await list_events(
+            start_datetime="2026-02-16T00:00:00",
+            end_datetime="2026-02-16T23:59:59",
+            ctx=mock_ctx,
+        )
+
+        assert second["events"][0]["subject"] == "Renamed"
+
+
+class TestBulkEventOps:
+    @pytest.mark.asyncio
+    async def test_runs_operations_concurrently_in_order(self, mock_ctx, mock_graph):
+        mock_graph.delete.return_value = None
+        mock_graph.post.return_value = {}
+
+        result = await bulk_event_ops(
+            ops=[
+                {"kind": "cancel", "event_id": "event-1"},
+                {"kind": "respond", "event_id": "event-2", "response": "accept"},
+            ],
+            ctx=mock_ctx,
+        )
+
+        assert result["count"] == 2
+        assert result["results"][0]["status"] == "cancelled"
+        assert result["results"][1]["status"] == "responded"
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_fails_only_that_op(self, mock_ctx, mock_graph):
+        mock_graph.delete.return_value = None
+
+        result = await bulk_event_ops(
+            ops=[
+                {"kind": "explode", "event_id": "event-1"},
+                {"kind": "cancel", "event_id": "event-2"},
+            ],
+            ctx=mock_ctx,
+        )
+
+        assert "kind must be one of" in result["results"][0]["error"]
+        assert result["results"][1]["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_empty_ops_rejected(self, mock_ctx, mock_graph):
+        result = await bulk_event_ops(ops=[], ctx=mock_ctx)
+        assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_bad_arguments_reported_per_op(self, mock_ctx, mock_graph):
+        result = await bulk_event_ops(
+            ops=[{"kind": "cancel", "event_id": "event-1", "bogus": True}],
+            ctx=mock_ctx,
+        )
+        assert "Invalid arguments for cancel" in result["results"][0]["error"]
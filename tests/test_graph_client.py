@@ -401,3 +401,202 @@ class TestAuthRetry:
 
         assert exc_info.value.status_code == 401
         mock_clear.assert_not_called()
+
+
+class TestTokenCaching:
+    """Tests for the in-memory access-token cache in _auth_headers."""
+
+    @pytest.mark.asyncio
+    async def test_token_reused_across_requests(self, monkeypatch):
+        calls: list[int] = []
+
+        def fake_get_token() -> str:
+            calls.append(1)
+            return "fake-token"
+
+        monkeypatch.setattr("office_assistant.graph_client.get_token", fake_get_token)
+        c = GraphClient()
+        try:
+            first = await c._auth_headers()
+            second = await c._auth_headers()
+        finally:
+            await c.close()
+
+        assert first["Authorization"] == "Bearer fake-token"
+        assert second["Authorization"] == "Bearer fake-token"
+        assert len(calls) == 1  # second call served from memory
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_refreshed(self, monkeypatch):
+        tokens = iter(["token-1", "token-2"])
+        monkeypatch.setattr("office_assistant.graph_client.get_token", lambda: next(tokens))
+        c = GraphClient()
+        try:
+            first = await c._auth_headers()
+            c._token_expires_at = 0.0  # simulate expiry
+            second = await c._auth_headers()
+        finally:
+            await c.close()
+
+        assert first["Authorization"] == "Bearer token-1"
+        assert second["Authorization"] == "Bearer token-2"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_token_drops_cached_state(self, monkeypatch):
+        monkeypatch.setattr("office_assistant.graph_client.get_token", lambda: "fake-token")
+        c = GraphClient()
+        try:
+            await c._auth_headers()
+            assert c._token == "fake-token"
+            c._invalidate_token()
+            assert c._token is None
+            assert c._token_expires_at == 0.0
+        finally:
+            await c.close()
+
+    def test_token_lifetime_from_jwt_exp(self):
+        import base64
+        import json
+        import time
+
+        exp = int(time.time()) + 3600
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+        token = f"header.{payload.decode()}.sig"
+
+        lifetime = GraphClient._token_lifetime(token)
+
+        assert 3590 < lifetime <= 3600
+
+    def test_token_lifetime_fallback_for_opaque_token(self):
+        lifetime = GraphClient._token_lifetime("not-a-jwt")
+        assert lifetime == 55 * 60.0
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_batch_demuxes_responses_in_request_order(self, client):
+        resp = _mock_response(
+            json_data={
+                "responses": [
+                    {"id": "1", "status": 200, "body": {"value": [{"id": "room-1"}]}},
+                    {"id": "0", "status": 200, "body": {"value": [{"id": "cal-1"}]}},
+                ]
+            }
+        )
+        client._http.request = AsyncMock(return_value=resp)
+
+        results = await client.batch(
+            [
+                {"method": "GET", "url": "/me/calendars"},
+                {"method": "GET", "url": "/places/microsoft.graph.room"},
+            ]
+        )
+
+        assert results[0]["body"]["value"][0]["id"] == "cal-1"
+        assert results[1]["body"]["value"][0]["id"] == "room-1"
+        # One HTTP round-trip for both sub-requests
+        assert client._http.request.call_count == 1
+        sent = client._http.request.call_args.kwargs["json"]
+        assert [r["id"] for r in sent["requests"]] == ["0", "1"]
+
+    @pytest.mark.asyncio
+    async def test_batch_empty_list_is_a_no_op(self, client):
+        client._http.request = AsyncMock()
+        assert await client.batch([]) == []
+        client._http.request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_more_than_twenty_requests(self, client):
+        requests = [{"method": "GET", "url": f"/me/events/{i}"} for i in range(21)]
+        with pytest.raises(ValueError, match="at most 20"):
+            await client.batch(requests)
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_caller_supplied_ids(self, client):
+        resp = _mock_response(json_data={"responses": [{"id": "mine", "status": 200, "body": {}}]})
+        client._http.request = AsyncMock(return_value=resp)
+
+        results = await client.batch([{"id": "mine", "method": "GET", "url": "/me"}])
+
+        assert results[0]["id"] == "mine"
+
+
+class TestMinimalWrites:
+    @pytest.mark.asyncio
+    async def test_post_minimal_sends_prefer_header_and_skips_parse(self, client):
+        resp = _mock_response(status_code=204, content=b"")
+        client._http.request = AsyncMock(return_value=resp)
+
+        result = await client.post("/me/events/1/cancel", json={"comment": "x"}, minimal=True)
+
+        assert result == {}
+        resp.json.assert_not_called()
+        sent_headers = client._http.request.call_args.kwargs["headers"]
+        assert sent_headers["Prefer"] == "return=minimal"
+
+    @pytest.mark.asyncio
+    async def test_patch_minimal_discards_body(self, client):
+        resp = _mock_response(json_data={"id": "event-1"})
+        client._http.request = AsyncMock(return_value=resp)
+
+        result = await client.patch("/me/events/1", json={"subject": "x"}, minimal=True)
+
+        assert result == {}
+        resp.json.assert_not_called()
+
+
+class TestEtagCache:
+    @pytest.mark.asyncio
+    async def test_second_get_revalidates_with_if_none_match(self, client):
+        resp = _mock_response(json_data={"id": "cal-1"}, headers={"ETag": 'W/"v1"'})
+        client._http.request = AsyncMock(return_value=resp)
+
+        await client.get("/me/calendars/cal-1")
+        await client.get("/me/calendars/cal-1")
+
+        first_headers = client._http.request.call_args_list[0].kwargs["headers"]
+        second_headers = client._http.request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == 'W/"v1"'
+
+    @pytest.mark.asyncio
+    async def test_304_serves_cached_body_without_parsing(self, client):
+        full = _mock_response(
+            json_data={"id": "cal-1", "name": "Calendar"}, headers={"ETag": 'W/"v1"'}
+        )
+        not_modified = _mock_response(status_code=304, content=b"")
+        client._http.request = AsyncMock(side_effect=[full, not_modified])
+
+        first = await client.get("/me/calendars/cal-1")
+        second = await client.get("/me/calendars/cal-1")
+
+        assert second == first
+        not_modified.json.assert_not_called()
+        # The caller gets a copy — mutating it must not poison the cache.
+        second["name"] = "mutated"
+        not_modified_again = _mock_response(status_code=304, content=b"")
+        client._http.request = AsyncMock(return_value=not_modified_again)
+        third = await client.get("/me/calendars/cal-1")
+        assert third["name"] == "Calendar"
+
+    @pytest.mark.asyncio
+    async def test_responses_without_etag_are_not_cached(self, client):
+        resp = _mock_response(json_data={"ok": True})
+        client._http.request = AsyncMock(return_value=resp)
+
+        await client.get("/me")
+        await client.get("/me")
+
+        for call in client._http.request.call_args_list:
+            assert "If-None-Match" not in call.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_cache_key(self, client):
+        resp = _mock_response(json_data={"value": []}, headers={"ETag": 'W/"v1"'})
+        client._http.request = AsyncMock(return_value=resp)
+
+        await client.get("/me/events", params={"$top": "10"})
+        await client.get("/me/events", params={"$top": "25"})
+
+        second_headers = client._http.request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in second_headers
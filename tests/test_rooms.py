@@ -75,6 +75,36 @@ class TestListRooms:
 
         assert result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_building_filter_sent_server_side(self, mock_ctx, mock_graph):
+        """The building filter is pushed to Graph via $filter."""
+        mock_graph.get_all.return_value = {"value": []}
+
+        await list_rooms(ctx=mock_ctx, building="HQ Tower")
+
+        params = mock_graph.get_all.call_args.kwargs["params"]
+        assert params["$filter"] == "contains(tolower(building), 'hq tower')"
+
+    @pytest.mark.asyncio
+    async def test_building_filter_falls_back_on_400(self, mock_ctx, mock_graph):
+        """Tenants that reject $filter on rooms get the unfiltered fetch."""
+        mock_graph.get_all.side_effect = [
+            GraphApiError(status_code=400, code="BadRequest", message="filter not supported"),
+            {
+                "value": [
+                    {"displayName": "Room A", "emailAddress": "a@c.com", "building": "HQ"},
+                    {"displayName": "Room B", "emailAddress": "b@c.com", "building": "Annex"},
+                ]
+            },
+        ]
+
+        result = await list_rooms(ctx=mock_ctx, building="HQ")
+
+        assert result["count"] == 1
+        assert result["rooms"][0]["displayName"] == "Room A"
+        retry_params = mock_graph.get_all.call_args_list[1].kwargs["params"]
+        assert "$filter" not in retry_params
+
     @pytest.mark.asyncio
     async def test_personal_account_error(self, mock_ctx, mock_graph):
         mock_graph.get_all.side_effect = GraphApiError(